@@ -13,12 +13,21 @@ logfile_list = [
 ]
 
 
-def _filter_log(keyword):
-    ret = Run("grep -nw '{}.*' {} --ignore-case --no-message".format(
-        keyword, ' '.join(logfile_list))).strip().split('\n')
-    while("" in ret):
-        ret.remove("")
-    return ret
+def _filter_logs(keywords):
+    # Start one grep per keyword before collecting any output, so the
+    # independent scans over the log files run concurrently.
+    procs = [subprocess.Popen(
+        "grep -nw '{}.*' {} --ignore-case --no-message".format(
+            keyword, ' '.join(logfile_list)),
+        shell=True, stdout=subprocess.PIPE) for keyword in keywords]
+    results = []
+    for proc in procs:
+        op = proc.communicate()[0]
+        RunLog.debug(op)
+        if py_ver_str[0] == '3':
+            op = op.decode('utf-8')
+        results.append([line for line in op.strip().split('\n') if line])
+    return results
 
 
 def RunTest():
@@ -27,9 +36,7 @@ def RunTest():
     RunLog.info(
         "Checking for ERROR/WARNING/FAILURE messages in system logs:{}".format(
             logfile_list))
-    errors = _filter_log('err')
-    warnings = _filter_log('warn')
-    failures = _filter_log('fail')
+    errors, warnings, failures = _filter_logs(['err', 'warn', 'fail'])
     if (not errors and not warnings and not failures):
         RunLog.info(
             'Could not find ERROR/WARNING/FAILURE messages in system log files.')
@@ -50,22 +57,24 @@ def RunTest():
             RunLog.info(
                 'Checking ignorable boot ERROR/WARNING/FAILURE messages...')
             for node in xml_root:
+                keyword_regexes = _compile_keywords(node)
                 if (failures and node.tag == "failures"):
-                    failures = RemoveIgnorableMessages(failures, node)
+                    failures = RemoveIgnorableMessages(failures, keyword_regexes)
                 if (errors and node.tag == "errors"):
-                    errors = RemoveIgnorableMessages(errors, node)
+                    errors = RemoveIgnorableMessages(errors, keyword_regexes)
                 if (warnings and node.tag == "warnings"):
-                    warnings = RemoveIgnorableMessages(warnings, node)
+                    warnings = RemoveIgnorableMessages(warnings, keyword_regexes)
 
             RunLog.info(
                 'Checking ignorable wala ERROR/WARNING/FAILURE messages...')
             for node in wala_xml_root:
+                keyword_regexes = _compile_keywords(node)
                 if failures:
-                    failures = RemoveIgnorableMessages(failures, node)
+                    failures = RemoveIgnorableMessages(failures, keyword_regexes)
                 if errors:
-                    errors = RemoveIgnorableMessages(errors, node)
+                    errors = RemoveIgnorableMessages(errors, keyword_regexes)
                 if warnings:
-                    warnings = RemoveIgnorableMessages(warnings, node)
+                    warnings = RemoveIgnorableMessages(warnings, keyword_regexes)
 
         if (errors or warnings or failures):
             RunLog.error('Found ERROR/WARNING/FAILURE messages in logs.')
@@ -87,11 +96,17 @@ def SplitLog(logType, logValues):
         RunLog.info(logType + ': ' + logEntry)
 
 
-def RemoveIgnorableMessages(message_list, keywords_xml_node):
+def _compile_keywords(keywords_xml_node):
+    # Compiled once per xml node and shared by the failures/errors/warnings
+    # passes, instead of being re-parsed for every log line.
+    return tuple(re.compile(keywords.text, re.M) for keywords in keywords_xml_node)
+
+
+def RemoveIgnorableMessages(message_list, keyword_regexes):
     valid_list = []
     for msg in message_list:
-        for keywords in keywords_xml_node:
-            if re.findall(keywords.text, msg, re.M):
+        for regex in keyword_regexes:
+            if regex.search(msg):
                 RunLog.info('Ignorable ERROR/WARNING/FAILURE message: ' + msg)
                 break
         else:
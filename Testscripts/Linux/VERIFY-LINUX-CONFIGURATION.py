@@ -33,8 +33,8 @@ def IsBashHistFileEmpty(file):
 def VerifySSHDConfig():
     global sshd_config_check_result
     RunLog.info("Checking ClientAliveInterval is into the /etc/ssh/sshd_config file")
-    ClientAliveIntervalLines = Run("cat /etc/ssh/sshd_config | grep -i '^ClientAliveInterval' | wc -l | tr -d ' ' | tr -d '\n'")
-    CommentClientAliveIntervalLines = Run("cat /etc/ssh/sshd_config | grep -i '^#ClientAliveInterval' | wc -l | tr -d ' ' | tr -d '\n'")
+    ClientAliveIntervalLines = Run("grep -ci '^ClientAliveInterval' /etc/ssh/sshd_config")
+    CommentClientAliveIntervalLines = Run("grep -ci '^#ClientAliveInterval' /etc/ssh/sshd_config")
 
     if (int(CommentClientAliveIntervalLines) != 0):
         print ("CLIENT_ALIVE_INTERVAL_COMMENTED")
@@ -2,7 +2,6 @@
 # Copyright (c) Microsoft Corporation. All rights reserved.
 # Licensed under the Apache License.
 from azuremodules import *
-import os.path
 import re
 
 swap_check_result = False
@@ -18,28 +17,19 @@ def CheckSwap(command):
     temp = Run(command)
     lsblkOutput = Run("lsblk")
     output = temp
-    if os.path.exists("/etc/lsb-release") and int(Run("cat /etc/lsb-release | grep -i coreos | wc -l")) > 0:
-        waagent_conf_file = "/usr/share/oem/waagent.conf"
-    elif (DetectDistro()[0] == 'clear-linux-os'):
-        waagent_conf_file = "/usr/share/defaults/waagent/waagent.conf"
-    else:
-        waagent_conf_file = "/etc/waagent.conf"
+    waagent_conf_file = GetWalaConfPath()
 
     RunLog.info("Read ResourceDisk.EnableSwap from " + waagent_conf_file + "..")
-    outputlist=open(waagent_conf_file)
-
-    for line in outputlist:
-        if(line.find("ResourceDisk.EnableSwap")!=-1):
-                break
-    RunLog.info("Value " + line.strip().split()[0] + " in " + waagent_conf_file)
-    if ((("swap" in output) or ("SWAP" in lsblkOutput)) and (line.strip().split()[0] == "ResourceDisk.EnableSwap=n")):
+    enable_swap = GetWalaConfValue(waagent_conf_file, "ResourceDisk.EnableSwap")
+    RunLog.info("Value ResourceDisk.EnableSwap=" + str(enable_swap) + " in " + waagent_conf_file)
+    if ((("swap" in output) or ("SWAP" in lsblkOutput)) and (enable_swap == "n")):
         RunLog.error('Swap is enabled. Swap should not be enabled.')
         RunLog.error('%s', output)
-    elif (((output.find("swap")==-1) or ("SWAP" in lsblkOutput)) and (line.strip().split()[0] == "ResourceDisk.EnableSwap=y")):
+    elif (((output.find("swap")==-1) or ("SWAP" in lsblkOutput)) and (enable_swap == "y")):
         RunLog.error('Swap is disabled. Swap should be enabled.')
         RunLog.error('%s', output)
         RunLog.info("Pleae check value of setting ResourceDisk.SwapSizeMB")
-    elif((("swap" in output) or ("SWAP" in lsblkOutput)) and (line.strip().split()[0] == "ResourceDisk.EnableSwap=y")):
+    elif((("swap" in output) or ("SWAP" in lsblkOutput)) and (enable_swap == "y")):
         RunLog.info('swap is enabled.')
         if(IsUbuntu()) :
             mntresource = "/mnt"
@@ -51,7 +41,7 @@ def CheckSwap(command):
             swap_check_result = True
         else:
             RunLog.info("swap is not enabled on resource disk")
-    elif(((output.find("swap")==-1) or ("SWAP" in lsblkOutput)) and (line.strip().split()[0] == "ResourceDisk.EnableSwap=n")):
+    elif(((output.find("swap")==-1) or ("SWAP" in lsblkOutput)) and (enable_swap == "n")):
         RunLog.info('swap is disabled.')
         swap_check_result = True
 
@@ -12,6 +12,12 @@ parser.add_argument('-d', '--distro', help='Please mention distro to test', requ
 args = parser.parse_args()
 distro = args.distro
 
+# Only the RHEL family ships /etc/system-release; read its version once
+# here instead of from every check that needs it.
+system_release_version = 0
+if distro == "CENTOS" or distro == "ORACLELINUX" or distro == "REDHAT" or distro == "FEDORA":
+    system_release_version = Run("cat /etc/system-release | grep -Eo '[0-9].?[0-9]?' | head -1 | tr -d '\n'")
+
 
 def verify_default_targetpw(distro):
     RunLog.info("Checking Defaults targetpw is commented or not..")
@@ -48,7 +54,7 @@ def verify_grub(distro):
     if distro == "CENTOS" or distro == "ORACLELINUX" or distro == "REDHAT" or distro == "SLES" or distro == "FEDORA":
         version_release = 0
         if distro == "REDHAT" or distro == "CENTOS":
-            version_release = Run("cat /etc/system-release | grep -Eo '[0-9].?[0-9]?' | head -1 | tr -d '\n'")
+            version_release = system_release_version
         if float(version_release) >= 8.0:
             RunLog.info("Getting Contents of /boot/grub2/grubenv")
             grub_out = Run("cat /boot/grub2/grubenv")
@@ -68,7 +74,7 @@ def verify_grub(distro):
     if "console=ttyS0" in grub_out and "libata.atapi_enabled=0" not in grub_out and "reserve=0x1f0,0x8" not in grub_out:
         if distro == "CENTOS" or distro == "ORACLELINUX" or distro == "REDHAT":
             # check numa=off in grub for CentOS 6.x and Oracle Linux 6.x
-            version_release = Run("cat /etc/system-release | grep -Eo '[0-9].?[0-9]?' | head -1 | tr -d '\n'")
+            version_release = system_release_version
             if float(version_release) < 6.6:
                 if "numa=off" in grub_out:
                     print(distro+"_TEST_GRUB_VERIFICATION_SUCCESS")
@@ -101,7 +107,7 @@ def verify_network_manager(distro):
     else:
         # NetworkManager package no longer conflicts with the wwagent on CentOS 7.0+ and Oracle Linux 7.0+
         if distro == "CENTOS" or distro == "ORACLELINUX" or distro == "REDHAT":
-            version_release = Run("cat /etc/system-release | grep -Eo '[0-9].?[0-9]?' | head -1 | tr -d '\n'")
+            version_release = system_release_version
             if float(version_release) < 7.0:
                 RunLog.error("Network Manager is installed")
                 print(distro+"_TEST_NETWORK_MANAGER_INSTALLED")
@@ -274,7 +280,7 @@ if distro == "CENTOS":
     result = verify_ifcfg_eth0(distro)
     result = verify_udev_rules(distro)
     #Verify repositories
-    version_release = Run("cat /etc/system-release | grep -Eo '[0-9].?[0-9]?' | head -1 | tr -d '\n'")
+    version_release = system_release_version
     r_out = Run("yum repolist")
     if "base" in r_out.lower() and (
         ("updates" in r_out.lower() and float(version_release) < 8.0)
@@ -311,7 +317,7 @@ if distro == "REDHAT" or distro == "FEDORA":
     result = verify_network_file_in_sysconfig(distro)
     result = verify_ifcfg_eth0(distro)
     result = verify_udev_rules(distro)
-    version_release = Run("cat /etc/system-release | grep -Eo '[0-9].?[0-9]?' | head -1 | tr -d '\n'")
+    version_release = system_release_version
     #Verify repositories
     r_out = Run("yum repolist")
     if "base" in r_out.lower() and (
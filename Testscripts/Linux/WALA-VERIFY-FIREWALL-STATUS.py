@@ -4,7 +4,6 @@
 from azuremodules import *
 import os
 import pwd
-import re
 import subprocess
 import sys
 
@@ -17,18 +16,13 @@ FIREWALL_USER = os.environ["SUDO_USER"]
 EXECUTION_USER = "root"
 WIRESERVER_ENDPOINT_FILE = '/var/lib/waagent/WireServerEndpoint'
 VERSIONS_PATH = '/?comp=versions'
-OS_ENABLE_FIREWALL_RX = r'OS.EnableFirewall\s*=\s*(\S+)'
-AGENT_CONFIG_FILE = Run("find / -name waagent.conf")
-AGENT_CONFIG_FILE = AGENT_CONFIG_FILE.rstrip()
+AGENT_CONFIG_FILE = GetWalaConfPath()
 
 
 def is_firewall_enabled():
-    with open(AGENT_CONFIG_FILE, 'r') as config_fh:
-        for line in config_fh.readlines():
-            if not line.startswith('#'):
-                update_match = re.match(OS_ENABLE_FIREWALL_RX, line, re.IGNORECASE)
-                if update_match:
-                    return update_match.groups()[0].lower() == 'y'
+    enable_firewall = GetWalaConfValue(AGENT_CONFIG_FILE, 'OS.EnableFirewall')
+    if enable_firewall:
+        return enable_firewall.lower() == 'y'
 
     # The firewall is enabled by default.
     return True
@@ -46,6 +40,11 @@ def run(*args):
 
 def RunTest():
     UpdateState("TestRunning")
+    if not os.path.exists(AGENT_CONFIG_FILE):
+        RunLog.error("Error -- waagent config file {0} does not exist".format(AGENT_CONFIG_FILE))
+        ResultLog.error('FAIL')
+        UpdateState("TestCompleted")
+        return
     if not is_firewall_enabled():
         RunLog.info("The firewall is not enabled, skipping checks")
         ResultLog.info('PASS')
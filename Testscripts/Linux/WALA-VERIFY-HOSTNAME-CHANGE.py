@@ -5,24 +5,18 @@ from azuremodules import *
 import random
 import string
 from random import randint
-import re
 
 file_path = os.path.dirname(os.path.realpath(__file__))
 constants_path = os.path.join(file_path, "constants.sh")
 params = GetParams(constants_path)
 expectedHostname = params["ROLENAME"]
-MONITOR_ENABLED = r'Provisioning.MonitorHostName\s*=\s*(\S+)'
-AGENT_CONFIG_FILE = Run("find / -name waagent.conf")
-AGENT_CONFIG_FILE = AGENT_CONFIG_FILE.rstrip()
+AGENT_CONFIG_FILE = GetWalaConfPath()
 
 
 def is_monitor_hostname_enabled():
-    with open(AGENT_CONFIG_FILE, 'r') as config_fh:
-        for line in config_fh.readlines():
-            if not line.startswith('#'):
-                update_match = re.match(MONITOR_ENABLED, line, re.IGNORECASE)
-                if update_match:
-                    return update_match.groups()[0].lower() == 'y'
+    monitor_hostname = GetWalaConfValue(AGENT_CONFIG_FILE, 'Provisioning.MonitorHostName')
+    if monitor_hostname:
+        return monitor_hostname.lower() == 'y'
     return True
 
 
@@ -33,6 +27,11 @@ def get_random_alphaNumeric_string(stringLength=8):
 
 def RunTest(expectedHost):
     UpdateState("TestRunning")
+    if not os.path.exists(AGENT_CONFIG_FILE):
+        RunLog.error("Error -- waagent config file {0} does not exist".format(AGENT_CONFIG_FILE))
+        ResultLog.error('FAIL')
+        UpdateState("TestCompleted")
+        return
     if not is_monitor_hostname_enabled():
         RunLog.info("The MonitorHostName is not enabled")
         Run("sed -i s/Provisioning.MonitorHostName=n/Provisioning.MonitorHostName=y/g " + AGENT_CONFIG_FILE)
@@ -68,7 +67,7 @@ def ChangeHostName(expectedHost):
     RunLog.info("Start to sleep for 120 seconds.")
     Run("sleep 120")
     expected_filter_string = "Detected hostname change: {0} -> {1}".format(expectedHost, changed_hostname)
-    matchCount = Run("grep -i '"+expected_filter_string+"' /var/log/waagent.log | wc -l")
+    matchCount = Run("grep -ci '"+expected_filter_string+"' /var/log/waagent.log")
     RunLog.info('Get matchCount {0}'.format(matchCount))
     # Changed matchCount condition to be >= 1 since it showed up 4 times in waagent.log file.
     if int(matchCount.rstrip()) >= 1 and CheckHostName(changed_hostname) and int(fail_error_warn_count.rstrip()) == 0:
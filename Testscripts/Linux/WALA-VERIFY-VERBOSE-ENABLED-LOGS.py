@@ -74,11 +74,11 @@ def Restartwaagent():
     else:
         Run("echo '"+passwd+"' | sudo -S sed -i s/Logs.Verbose=n/Logs.Verbose=y/g  /etc/waagent.conf")
     RunLog.info("Restart waagent service...")
-    result = Run("echo '"+passwd+"' | sudo -S find / -name systemctl |wc -l | tr -d '\n'")
+    result = Run("command -v systemctl")
     if (distro[0].upper() == "UBUNTU") or (distro[0].upper() == "DEBIAN"):
         Run("echo '"+passwd+"' | sudo -S service walinuxagent restart")
     else:
-        if (result == "0") :
+        if (result == "") :
             os.system("echo '"+passwd+"' | sudo -S service waagent restart")
         else:
             os.system("echo '"+passwd+"' | sudo -S systemctl restart waagent")
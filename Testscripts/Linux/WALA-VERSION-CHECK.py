@@ -8,16 +8,16 @@ file_path = os.path.dirname(os.path.realpath(__file__))
 constants_path = os.path.join(file_path, "constants.sh")
 params = GetParams(constants_path)
 distro = params["DETECTED_DISTRO"]
+ExpectedVersionPattern = "WALinuxAgent\-\d[\.\d]+.*\ running\ on.*"
+ExpectedVersionRegex = re.compile(ExpectedVersionPattern)
 
 
 def RunTest(command):
     UpdateState("TestRunning")
     RunLog.info("Checking WALinuxAgent Version")
     output = Run(command)
-    ExpectedVersionPattern = "WALinuxAgent\-\d[\.\d]+.*\ running\ on.*"
-    RegExp = re.compile(ExpectedVersionPattern)
 
-    if (RegExp.match(output)) :
+    if (ExpectedVersionRegex.match(output)) :
         RunLog.info('Waagent is in Latest Version .. - %s', output)
         ResultLog.info('PASS')
         UpdateState("TestCompleted")
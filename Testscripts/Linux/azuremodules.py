@@ -64,12 +64,11 @@ def GetParams(file_path):
     params = dict()
 
     with open(file_path) as file:
-        lines = file.readlines()
-        for line in lines:
+        for line in file:
             if not line.startswith("#"):
-                param_name = line.split("=")[0].strip()
-                param_value = line.split("=")[1].strip().strip('"')
-                params[param_name] = param_value
+                # maxsplit keeps the old value semantics (second field only) with a single split
+                fields = line.split("=", 2)
+                params[fields[0].strip()] = fields[1].strip().strip('"')
     return params
  
  
@@ -91,30 +90,54 @@ def DownloadUrl(url, destination_folder, output_file=None):
         return False
 
 
+#DetectDistro() patterns, compiled once at import instead of on every line it scans.
+DistroIdRegex = re.compile(r'^ID=(.*)', re.M|re.I)
+DistroReleaseLineRegex = re.compile(r'.*[ \t]release (.*) .*', re.M|re.I)
+DistroReleaseVersionRegex = re.compile(r'.*release (.*) \(.*', re.M|re.I)
+DistroVersionIdRegex = re.compile(r'^VERSION_ID=(.*)', re.M|re.I)
+DistroNameRegexes = (
+    (re.compile(r'.*Ubuntu.*', re.M|re.I), 'ubuntu'),
+    (re.compile(r'.*SUSE Linux.*', re.M|re.I), 'SUSE'),
+    (re.compile(r'.*openSUSE.*', re.M|re.I), 'opensuse'),
+    (re.compile(r'.*centos.*', re.M|re.I), 'centos'),
+    (re.compile(r'.*Oracle.*', re.M|re.I), 'Oracle'),
+    (re.compile(r'.*Red Hat.*', re.M|re.I), 'rhel'),
+    (re.compile(r'.*Fedora.*', re.M|re.I), 'fedora'),
+)
+
+#[distribution, version] found by the first DetectDistro() call; the release files don't change during a test run.
+DetectedDistro = None
+
+
 def DetectDistro():
+    global DetectedDistro
+    if DetectedDistro is not None:
+        return list(DetectedDistro)
+
     distribution = 'unknown'
     version = 'unknown'
 
     RunLog.info("Detecting Distro ")
     output = Run("cat /etc/*-release")
     if output == "" and os.path.isfile("/usr/lib/os-release"):
-        output = Run("cat /usr/lib/os-release")
-    if output == "" and os.path.exists("/etc/lsb-release") and int(Run("cat /etc/lsb-release | grep -i coreos | wc -l")) > 0:
-        output = Run("cat /etc/lsb-release")
+        output = FileGetContents("/usr/lib/os-release")
+    if output == "" and IsCoreOS():
+        output = FileGetContents("/etc/lsb-release")
 
-    outputlist = re.split("\n", output)
+    #drop quotes in one pass over the whole output rather than per line
+    outputlist = re.split("\n", output.replace('"', ''))
 
     for line in outputlist:
-        line = re.sub('"', '', line)
-        if (re.match(r'^ID=(.*)', line, re.M|re.I) ):
-            matchObj = re.match( r'^ID=(.*)', line, re.M|re.I)
+        matchObj = DistroIdRegex.match(line)
+        if (matchObj):
             distribution  = matchObj.group(1)
-        elif (re.match(r'.*[ \t]release (.*) .*', line, re.M|re.I) ):
-            matchObj = re.match( r'.*release (.*) \(.*', line, re.M|re.I)
-            version = matchObj.group(1)
-        elif (version == "unknown" and re.match(r'^VERSION_ID=(.*)', line, re.M|re.I) ):
-            matchObj = re.match( r'^VERSION_ID=(.*)', line, re.M|re.I)
+        elif (DistroReleaseLineRegex.match(line)):
+            matchObj = DistroReleaseVersionRegex.match(line)
             version = matchObj.group(1)
+        elif (version == "unknown"):
+            matchObj = DistroVersionIdRegex.match(line)
+            if (matchObj):
+                version = matchObj.group(1)
 
     if(distribution.strip() == "ol"):
         distribution = 'Oracle'
@@ -122,28 +145,14 @@ def DetectDistro():
     if(distribution == 'unknown'):
         # Finding the Distro
         for line in outputlist:
-            if (re.match(r'.*Ubuntu.*', line, re.M|re.I) ):
-                distribution = 'ubuntu'
-                break
-            elif (re.match(r'.*SUSE Linux.*', line, re.M|re.I)):
-                distribution = 'SUSE'
-                break
-            elif (re.match(r'.*openSUSE.*', line, re.M|re.I)):
-                distribution = 'opensuse'
-                break
-            elif (re.match(r'.*centos.*', line, re.M|re.I)):
-                distribution = 'centos'
-                break
-            elif (re.match(r'.*Oracle.*', line, re.M|re.I)):
-                distribution = 'Oracle'
-                break
-            elif (re.match(r'.*Red Hat.*', line, re.M|re.I)):
-                distribution = 'rhel'
-                break
-            elif (re.match(r'.*Fedora.*', line, re.M|re.I)):
-                distribution = 'fedora'
+            for regex, name in DistroNameRegexes:
+                if (regex.match(line)):
+                    distribution = name
+                    break
+            if (distribution != 'unknown'):
                 break
-    return [distribution, version]
+    DetectedDistro = [distribution, version]
+    return list(DetectedDistro)
 
 
 def FileGetContents(filename):
@@ -175,49 +184,90 @@ def DetectLinuxDistro():
     return (False, "Unknown")
 
 
+def IsCoreOS():
+    lsb_release = GetFileContents("/etc/lsb-release")
+    return lsb_release is not None and "coreos" in lsb_release.lower()
+
+
 def IsUbuntu():
-        cmd = "cat /etc/issue"
-        tmp = Run(cmd)
-        if type(tmp) == bytes:
-            tmp = tmp.decode("utf-8")
-        return ("Ubuntu" in tmp)
+    issue = GetFileContents("/etc/issue")
+    return issue is not None and "Ubuntu" in issue
+
+
+#Matches the leading "key=value" token of every uncommented waagent.conf line.
+WalaConfRegex = re.compile(r'^[ \t]*([^#\s=][^\s=]*)=([^\s=]*)(?!\S)', re.M)
+#Parsed waagent.conf dicts keyed by path, each stored with the (mtime, inode, size) it was parsed at.
+#Tests edit the file with sed -i, which writes a new inode and can keep the same mtime, so any change invalidates the entry.
+WalaConfCache = {}
 
 
 def ParseWalaConf2Dict(walaconfpath):
     d = None
     if os.path.exists(walaconfpath):
-        d={}
-        lines = GetFileContentsByLines(walaconfpath)
-        configs_list = [x.strip().split()[0] for x in lines if not x.startswith('#') and not x.startswith('\n')]
-        for x in configs_list:
-            try:
-                k, v=x.split('=')
-                d.setdefault(k, v)
-            except Exception:
-                pass
+        st = os.stat(walaconfpath)
+        stamp = (st.st_mtime, st.st_ino, st.st_size)
+        cached = WalaConfCache.get(walaconfpath)
+        if cached and cached[0] == stamp:
+            return dict(cached[1])
+        #reversed() keeps the first occurrence of a duplicated key
+        d = dict(reversed(WalaConfRegex.findall(FileGetContents(walaconfpath))))
+        WalaConfCache[walaconfpath] = (stamp, d)
+        #hand out a copy so callers can't modify the cached dict
+        d = dict(d)
     else:
         RunLog.error("%s is not exists, please check." % walaconfpath)
     return d
 
 
+def GetWalaConfValue(walaconfpath, key):
+    #Single-key lookup for settings read once per script: search() stops at the first uncommented "key=value" line
+    #instead of parsing the whole file. Use ParseWalaConf2Dict() for repeated lookups, it is cached.
+    value = None
+    if os.path.exists(walaconfpath):
+        regex = re.compile(r'^[ \t]*%s[ \t]*=[ \t]*(\S+)' % re.escape(key), re.M|re.I)
+        matchObj = regex.search(FileGetContents(walaconfpath))
+        if matchObj:
+            value = matchObj.group(1)
+    else:
+        RunLog.error("%s is not exists, please check." % walaconfpath)
+    return value
+
+
+#Known waagent.conf locations, checked when the distro default is missing (e.g. FreeBSD uses /usr/local/etc).
+WalaConfPaths = (
+    "/etc/waagent.conf",
+    "/usr/share/oem/waagent.conf",
+    "/usr/share/defaults/waagent/waagent.conf",
+    "/usr/local/etc/waagent.conf",
+)
+
+
 def GetWalaConfPath():
-    if os.path.exists("/etc/lsb-release") and int(Run("cat /etc/lsb-release | grep -i coreos | wc -l")) > 0:
-        return "/usr/share/oem/waagent.conf"
+    if IsCoreOS():
+        walaconfpath = "/usr/share/oem/waagent.conf"
     elif DetectDistro()[0] == 'clear-linux-os':
-        return "/usr/share/defaults/waagent/waagent.conf"
+        walaconfpath = "/usr/share/defaults/waagent/waagent.conf"
     else:
-        return "/etc/waagent.conf"
+        walaconfpath = "/etc/waagent.conf"
+    if not os.path.exists(walaconfpath):
+        for path in WalaConfPaths:
+            if os.path.exists(path):
+                RunLog.info("%s not found, using %s" % (walaconfpath, path))
+                return path
+    return walaconfpath
 
 
 def GetResourceDiskMountPoint():
-    walacfg_path = GetWalaConfPath()
-    walacfg_dict = ParseWalaConf2Dict(walacfg_path)
-
     if os.path.exists('/var/log/cloud-init.log') and os.path.islink('/var/lib/cloud/instance'):
         RunLog.info('ResourceDisk handled by cloud-init.')
         return '/mnt'
     else:
         RunLog.info("ResourceDisk handled by waagent.")
+        walacfg_path = GetWalaConfPath()
+        walacfg_dict = ParseWalaConf2Dict(walacfg_path)
+        if not walacfg_dict or 'ResourceDisk.MountPoint' not in walacfg_dict:
+            RunLog.error("ResourceDisk.MountPoint is not set in %s." % walacfg_path)
+            raise KeyError('ResourceDisk.MountPoint')
         return walacfg_dict['ResourceDisk.MountPoint']
 
 